@@ -1,26 +1,186 @@
 import os
-from datetime import datetime, timedelta
-from flask import Flask, request, jsonify, Response
+import atexit
+import csv
+import io
+import queue
+import select
+import gzip
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+from html import escape
+from flask import Flask, g, request, jsonify, Response
+from flask.json.provider import DefaultJSONProvider
+import brotli
+import orjson
 import psycopg2
-import psycopg2.extras
+import psycopg2.pool
 
-app = Flask(__name__)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """request.get_json() 파싱과 jsonify() 직렬화를 orjson(C 구현)으로 처리"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # str 로 바꿨다가 다시 인코딩하지 않고 orjson 의 bytes 를 그대로 본문으로 사용
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default), mimetype=self.mimetype)
+
+
+app = Flask(__name__, static_folder=None)
+app.json = ORJSONProvider(app)
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# 접속 시 한 번만 전달되는 세션 설정.
+# synchronous_commit=off: 커밋마다 WAL fsync를 기다리지 않음 (DB 서버가 죽으면 직전 수백 ms 커밋만 유실될 수 있고, 데이터 손상은 없음)
+# statement_timeout / idle_in_transaction_session_timeout: 느린 쿼리나 열린 채 남은 트랜잭션이 풀 연결을 오래 붙잡지 않도록 (ms)
+# application_name: pg_stat_activity 에서 이 앱의 연결을 구분
+PG_SESSION_OPTIONS = " ".join((
+    "-c synchronous_commit={}".format(os.getenv("PG_SYNCHRONOUS_COMMIT", "off")),
+    "-c statement_timeout={}".format(os.getenv("PG_STATEMENT_TIMEOUT_MS", "5000")),
+    "-c idle_in_transaction_session_timeout={}".format(os.getenv("PG_IDLE_TX_TIMEOUT_MS", "10000")),
+    "-c application_name=sanhak-calendar",
+))
+
 
-def get_conn():
+def connect_db(**kwargs):
     if not DATABASE_URL:
         raise RuntimeError("DATABASE_URL 환경변수가 설정되어 있지 않습니다.")
-    return psycopg2.connect(DATABASE_URL, sslmode="require")
+    return psycopg2.connect(DATABASE_URL, sslmode="require", options=PG_SESSION_OPTIONS, **kwargs)
+
+
+# 워커 프로세스 안의 스레드들이 함께 쓰는 연결 풀 (요청마다 TCP/TLS/인증을 새로 하지 않음)
+# 연결이 모두 나가 있으면 바로 실패하지 않고 이 시간(초)까지 반납을 기다린다
+PG_POOL_WAIT_SECONDS = float(os.getenv("PG_POOL_WAIT_SECONDS", "10"))
+_pool = None
+_pool_slots = None
+_pool_lock = threading.Lock()
+
+
+def _worker_threads():
+    # 실제 gunicorn 스레드 수 (gunicorn.conf.py 의 post_fork 가 --threads 값까지 반영해 넘겨줌)
+    return int(os.getenv("GUNICORN_THREADS", "32"))
+
+
+def _pool_size():
+    # SSE 스트림 스레드는 열 때 버전을 한 번 읽을 뿐이므로 기본 크기는 일반 요청용으로 남긴 스레드 수
+    return int(os.getenv("PG_POOL_MAX") or max(1, _worker_threads() - _stream_limit()))
+
+
+def _get_pool():
+    global _pool, _pool_slots
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                if not DATABASE_URL:
+                    raise RuntimeError("DATABASE_URL 환경변수가 설정되어 있지 않습니다.")
+                size = _pool_size()
+                _pool_slots = threading.BoundedSemaphore(size)
+                _pool = psycopg2.pool.ThreadedConnectionPool(
+                    1, size, DATABASE_URL, sslmode="require", options=PG_SESSION_OPTIONS
+                )
+                atexit.register(_pool.closeall)
+    return _pool
+
+
+def _checkout():
+    # ThreadedConnectionPool.getconn 은 남은 연결이 없으면 즉시 PoolError → 세마포어로 빈 자리를 기다린다
+    pool = _get_pool()
+    if not _pool_slots.acquire(timeout=PG_POOL_WAIT_SECONDS):
+        raise psycopg2.pool.PoolError("connection pool exhausted")
+    try:
+        conn = pool.getconn()
+        if not conn.autocommit:
+            conn.autocommit = True
+    except BaseException:
+        _pool_slots.release()
+        raise
+    return conn
+
+
+def _checkin(conn):
+    try:
+        # 끊긴 연결은 풀에 돌려놓지 않고 버린다 (다음 getconn 때 새로 접속)
+        _pool.putconn(conn, close=bool(conn.closed))
+    finally:
+        _pool_slots.release()
+
+
+def get_db():
+    """요청 동안 쓸 연결. 처음 필요할 때 풀에서 빌리고, 반납은 teardown 에서 한 번에 한다."""
+    if "db" not in g:
+        g.db = _checkout()
+    return g.db
+
+
+@app.teardown_appcontext
+def _release_db(exc):
+    # 예외/에러 핸들러 경로를 포함해 모든 요청 끝에서 반드시 실행됨
+    conn = g.pop("db", None)
+    if conn is None:
+        return
+    try:
+        if not conn.closed and not conn.autocommit:
+            # 커밋은 transaction() 에서 끝나므로 여기까지 열린 트랜잭션은 버린다
+            conn.rollback()
+            conn.autocommit = True
+    finally:
+        _checkin(conn)
+
+
+@contextmanager
+def db_conn():
+    """요청 밖(SSE 스트림 등)에서 쓰는 연결. 블록이 끝나면 (예외가 나도) 반납한다."""
+    conn = _checkout()
+    try:
+        yield conn
+    finally:
+        _checkin(conn)
+
+
+@contextmanager
+def transaction(conn, **cursor_kwargs):
+    """
+    쓰기 요청의 여러 문장을 BEGIN ... COMMIT 하나로 묶는다.
+    (autocommit이면 문장마다 커밋 → 기간 등록 시 날짜 수만큼 커밋이 발생)
+    """
+    conn.autocommit = False
+    try:
+        with conn.cursor(**cursor_kwargs) as cur:
+            yield cur
+        conn.commit()
+    except BaseException:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    finally:
+        if not conn.closed:
+            conn.autocommit = True
 
 
 def parse_date(s: str):
+    # YYYY-MM-DD, 0을 채우지 않은 YYYY-M-D 도 허용 (제외 날짜는 사용자가 직접 입력)
     if not s:
         return None
+    parts = s.split("-")
+    if len(parts) != 3:
+        return None
+    y, m, d = parts
+    if not (len(y) == 4 and 1 <= len(m) <= 2 and 1 <= len(d) <= 2):
+        return None
+    if not (y + m + d).isascii() or not (y + m + d).isdigit():
+        return None
     try:
-        return datetime.strptime(s, "%Y-%m-%d").date()
-    except Exception:
+        return date(int(y), int(m), int(d))
+    except ValueError:
         return None
 
 
@@ -31,6 +191,123 @@ def clean_str(v):
     return v if v != "" else None
 
 
+# 스키마를 바꾸면 올린다. DB에 기록된 값과 같으면 init_db 는 DDL 을 건너뜀
+_SCHEMA_VERSION = 3
+# 여러 워커가 동시에 부팅해도 마이그레이션은 한 번에 하나만 (pg_advisory_lock 키)
+_MIGRATION_LOCK_KEY = 0x5A4E4B01
+
+# init_db 전체를 한 번의 execute(왕복 1회)로 보낸다.
+# autocommit 상태에서 여러 문장을 한 문자열로 보내면 Postgres 가 하나의 트랜잭션으로 묶어 실행(중간 실패 시 전부 롤백).
+_INIT_DB_SQL = """
+-- 1) businesses
+CREATE TABLE IF NOT EXISTS businesses (
+    id SERIAL PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+-- 2) events (없으면 생성)
+CREATE TABLE IF NOT EXISTS events (
+    id SERIAL PRIMARY KEY,
+    event_date DATE,
+    "start" DATE,
+    "end" DATE,
+    business TEXT,
+    course TEXT,
+    time_range TEXT,
+    people TEXT,
+    place TEXT,
+    admin TEXT,
+    memo TEXT,
+    color_key TEXT,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+-- 3) 필요한 컬럼이 없으면 추가 (ALTER 한 문장에 여러 절)
+ALTER TABLE events
+    ADD COLUMN IF NOT EXISTS event_date DATE,
+    ADD COLUMN IF NOT EXISTS "start" DATE,
+    ADD COLUMN IF NOT EXISTS "end" DATE,
+    ADD COLUMN IF NOT EXISTS business TEXT,
+    ADD COLUMN IF NOT EXISTS course TEXT,
+    ADD COLUMN IF NOT EXISTS time_range TEXT,
+    ADD COLUMN IF NOT EXISTS people TEXT,
+    ADD COLUMN IF NOT EXISTS place TEXT,
+    ADD COLUMN IF NOT EXISTS admin TEXT,
+    ADD COLUMN IF NOT EXISTS memo TEXT,
+    ADD COLUMN IF NOT EXISTS color_key TEXT,
+    ADD COLUMN IF NOT EXISTS created_at TIMESTAMP DEFAULT NOW();
+
+-- 4) ✅ 타입 꼬임 해결: text -> date 안전 변환 (세 컬럼을 한 번의 테이블 재작성으로)
+ALTER TABLE events
+    ALTER COLUMN event_date TYPE DATE
+    USING (
+        CASE
+            WHEN event_date IS NULL THEN NULL
+            WHEN (event_date)::text ~ '^\\d{4}-\\d{2}-\\d{2}$' THEN (event_date)::date
+            ELSE NULL
+        END
+    ),
+    ALTER COLUMN "start" TYPE DATE
+    USING (
+        CASE
+            WHEN "start" IS NULL THEN NULL
+            WHEN ("start")::text ~ '^\\d{4}-\\d{2}-\\d{2}$' THEN ("start")::date
+            ELSE NULL
+        END
+    ),
+    ALTER COLUMN "end" TYPE DATE
+    USING (
+        CASE
+            WHEN "end" IS NULL THEN NULL
+            WHEN ("end")::text ~ '^\\d{4}-\\d{2}-\\d{2}$' THEN ("end")::date
+            ELSE NULL
+        END
+    );
+
+-- 5) 기존 데이터 보정
+UPDATE events SET event_date = COALESCE(event_date, "start") WHERE event_date IS NULL;
+UPDATE events SET "start" = COALESCE("start", event_date) WHERE "start" IS NULL;
+UPDATE events SET "end" = COALESCE("end", event_date) WHERE "end" IS NULL;
+
+-- business NULL 보정 후 NOT NULL
+UPDATE events SET business = COALESCE(business, '미분류') WHERE business IS NULL;
+
+-- 6) NOT NULL 제약
+ALTER TABLE events
+    ALTER COLUMN event_date SET NOT NULL,
+    ALTER COLUMN "start" SET NOT NULL,
+    ALTER COLUMN "end" SET NOT NULL,
+    ALTER COLUMN business SET NOT NULL;
+
+-- 7) index
+-- 목록 조회의 ORDER BY event_date, id 를 정렬 없이 인덱스 순서로 읽기 위함
+CREATE INDEX IF NOT EXISTS idx_events_date_id ON events(event_date, id);
+-- event_date 단독 인덱스는 위 복합 인덱스의 앞부분과 같아서 쓰기 비용만 늘림
+DROP INDEX IF EXISTS idx_events_date;
+-- 사업별 필터(business = ? AND 기간) 도 같은 순서로 바로 읽도록 복합 인덱스 사용
+CREATE INDEX IF NOT EXISTS idx_events_business_date_id ON events(business, event_date, id);
+DROP INDEX IF EXISTS idx_events_business;
+
+-- 8) seed "전체"
+INSERT INTO businesses(name) VALUES ('전체') ON CONFLICT (name) DO NOTHING;
+
+-- 9) 데이터 버전 (쓰기마다 +1, 조회 캐시 무효화용 — 여러 워커가 같은 값을 봄)
+CREATE TABLE IF NOT EXISTS data_versions (
+    name TEXT PRIMARY KEY,
+    ver BIGINT NOT NULL DEFAULT 0
+);
+INSERT INTO data_versions(name) VALUES ('events'), ('businesses') ON CONFLICT (name) DO NOTHING;
+
+-- 테이블을 (event_date, id) 순서로 한 번 재배치해 기간 조회가 인접한 페이지만 읽도록 함
+-- (마이그레이션 때만 실행되므로 이후 쓰기로 순서가 조금씩 흐트러질 수 있음)
+CLUSTER events USING idx_events_date_id;
+
+-- 10) 위 보정 UPDATE/새 인덱스 이후 통계를 바로 갱신 (autovacuum 을 기다리지 않고 첫 조회부터 인덱스 사용)
+ANALYZE events;
+"""
+
+
 def init_db():
     """
     ✅ 목표: 어떤 꼬인 DB 스키마/타입이 와도 현재 코드 기준으로 안전하게 맞춘다.
@@ -38,102 +315,35 @@ def init_db():
     - event_date / "start" / "end" 가 TEXT여도 DATE로 강제 변환 (YYYY-MM-DD만 통과)
     - business NULL이 있으면 '미분류'로 채운 뒤 NOT NULL
     - start/end NOT NULL 기존 테이블과 호환
+    - 이미 _SCHEMA_VERSION 까지 맞춰진 DB면 아무 DDL 도 보내지 않음
     """
-    conn = get_conn()
+    # 마이그레이션을 배포 단계에서 따로 돌린다면 웹 워커에는 RUN_MIGRATIONS=0
+    if os.getenv("RUN_MIGRATIONS", "1") != "1":
+        return
+    conn = connect_db()
     conn.autocommit = True
     try:
         with conn.cursor() as cur:
-            # 1) businesses
-            cur.execute(
-                """
-                CREATE TABLE IF NOT EXISTS businesses (
-                    id SERIAL PRIMARY KEY,
-                    name TEXT UNIQUE NOT NULL,
-                    created_at TIMESTAMP DEFAULT NOW()
-                );
-                """
-            )
-
-            # 2) events (없으면 생성)
-            cur.execute(
-                """
-                CREATE TABLE IF NOT EXISTS events (
-                    id SERIAL PRIMARY KEY,
-                    event_date DATE,
-                    "start" DATE,
-                    "end" DATE,
-                    business TEXT,
-                    course TEXT,
-                    time_range TEXT,
-                    people TEXT,
-                    place TEXT,
-                    admin TEXT,
-                    memo TEXT,
-                    color_key TEXT,
-                    created_at TIMESTAMP DEFAULT NOW()
-                );
-                """
-            )
-
-            # 3) 필요한 컬럼이 없으면 추가
-            alter_cols = [
-                ("event_date", "DATE"),
-                ('"start"', "DATE"),
-                ('"end"', "DATE"),
-                ("business", "TEXT"),
-                ("course", "TEXT"),
-                ("time_range", "TEXT"),
-                ("people", "TEXT"),
-                ("place", "TEXT"),
-                ("admin", "TEXT"),
-                ("memo", "TEXT"),
-                ("color_key", "TEXT"),
-                ("created_at", "TIMESTAMP DEFAULT NOW()"),
-            ]
-            for col, typ in alter_cols:
-                cur.execute(f"ALTER TABLE events ADD COLUMN IF NOT EXISTS {col} {typ};")
-
-            # 4) ✅ 타입 꼬임 해결: text -> date 안전 변환
-            def force_date(colname: str):
+            # 마이그레이션(락 대기, CLUSTER 등)은 요청용 statement_timeout 을 적용하지 않음
+            cur.execute("SET statement_timeout = 0;")
+            # 다른 워커가 마이그레이션 중이면 끝날 때까지 기다린 뒤 버전을 확인
+            cur.execute("SELECT pg_advisory_lock(%s);", (_MIGRATION_LOCK_KEY,))
+            ver = None
+            cur.execute("SELECT to_regclass('data_versions');")
+            if cur.fetchone()[0] is not None:
+                cur.execute("SELECT ver FROM data_versions WHERE name = 'schema';")
+                row = cur.fetchone()
+                ver = row[0] if row else None
+            # 더 새 버전으로 이미 맞춰진 DB(예: 롤백된 이전 빌드가 부팅)에는 DDL 을 다시 돌리지 않는다
+            if ver is None or ver < _SCHEMA_VERSION:
+                cur.execute(_INIT_DB_SQL)
                 cur.execute(
-                    f"""
-                    ALTER TABLE events
-                    ALTER COLUMN {colname} TYPE DATE
-                    USING (
-                        CASE
-                            WHEN {colname} IS NULL THEN NULL
-                            WHEN ({colname})::text ~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}$' THEN ({colname})::date
-                            ELSE NULL
-                        END
-                    );
-                    """
+                    "INSERT INTO data_versions(name, ver) VALUES ('schema', %s) "
+                    "ON CONFLICT (name) DO UPDATE SET ver = EXCLUDED.ver;",
+                    (_SCHEMA_VERSION,),
                 )
-
-            force_date("event_date")
-            force_date('"start"')
-            force_date('"end"')
-
-            # 5) 기존 데이터 보정
-            cur.execute('UPDATE events SET event_date = COALESCE(event_date, "start") WHERE event_date IS NULL;')
-            cur.execute('UPDATE events SET "start" = COALESCE("start", event_date) WHERE "start" IS NULL;')
-            cur.execute('UPDATE events SET "end" = COALESCE("end", event_date) WHERE "end" IS NULL;')
-
-            # business NULL 보정 후 NOT NULL
-            cur.execute("UPDATE events SET business = COALESCE(business, '미분류') WHERE business IS NULL;")
-
-            # 6) NOT NULL 제약
-            cur.execute('ALTER TABLE events ALTER COLUMN event_date SET NOT NULL;')
-            cur.execute('ALTER TABLE events ALTER COLUMN "start" SET NOT NULL;')
-            cur.execute('ALTER TABLE events ALTER COLUMN "end" SET NOT NULL;')
-            cur.execute("ALTER TABLE events ALTER COLUMN business SET NOT NULL;")
-
-            # 7) index
-            cur.execute("CREATE INDEX IF NOT EXISTS idx_events_date ON events(event_date);")
-            cur.execute("CREATE INDEX IF NOT EXISTS idx_events_business ON events(business);")
-
-            # 8) seed "전체"
-            cur.execute("INSERT INTO businesses(name) VALUES (%s) ON CONFLICT (name) DO NOTHING;", ("전체",))
     finally:
+        # 세션이 끝나면 advisory lock 도 함께 풀린다
         conn.close()
 
 
@@ -148,39 +358,166 @@ def handle_any_error(e):
 init_db()
 
 
-def event_row_to_dict(r):
-    d = r.get("event_date") or r.get("start")
-    if hasattr(d, "strftime"):
-        d = d.strftime("%Y-%m-%d")
-    return {
-        "id": r["id"],
-        "event_date": d,
-        "business": r.get("business"),
-        "course": r.get("course"),
-        "time": r.get("time_range"),
-        "people": r.get("people"),
-        "place": r.get("place"),
-        "admin": r.get("admin"),
-        "memo": r.get("memo"),
-        "color_key": r.get("color_key"),
-    }
+# ---- SQL (요청마다 문자열을 새로 만들지 않도록 모듈 상수로 고정) ----
+
+# (응답 JSON 키, SQL 식) — event_date 는 date 객체 그대로 두고 orjson 이 "YYYY-MM-DD" 로 직렬화
+_EVENT_FIELDS = (
+    ("id", "id"),
+    ("event_date", "event_date"),
+    ("business", "business"),
+    ("course", "course"),
+    ("time", "time_range"),
+    ("people", "people"),
+    ("place", "place"),
+    ("admin", "admin"),
+    ("memo", "memo"),
+    ("color_key", "color_key"),
+)
+# 컬럼 순서가 고정이므로 키 튜플도 한 번만 만들어 두고 행마다 zip 한다 (cur.description 조회 불필요)
+_EVENT_KEYS = tuple(key for key, _ in _EVENT_FIELDS)
+_EVENT_COLUMNS = ", ".join(expr for _, expr in _EVENT_FIELDS)
+
+_SQL_LIST_EVENTS = f"SELECT {_EVENT_COLUMNS} FROM events WHERE 1=1"
+_SQL_LIST_EVENTS_ORDER = " ORDER BY event_date ASC, id ASC;"
+
+# 대량 등록: SQL 파싱 없이 CSV 스트림을 그대로 적재
+_SQL_COPY_EVENTS = """
+    COPY events(event_date, "start", "end", business, course, time_range, people, place, admin, memo, color_key)
+    FROM STDIN WITH (FORMAT csv)
+"""
+
+# 기간의 날짜 펼치기/제외일 거르기를 DB에서 한 문장으로 처리 (파이썬 쪽 날짜 반복 없음)
+_SQL_INSERT_EVENT_RANGE = f"""
+    INSERT INTO events(event_date, "start", "end", business, course, time_range, people, place, admin, memo, color_key)
+    SELECT g.d::date, g.d::date, g.d::date, %s, %s, %s, %s, %s, %s, %s, %s
+    FROM generate_series(%s::date, %s::date, interval '1 day') AS g(d)
+    WHERE g.d::date <> ALL(%s::date[])
+    ORDER BY g.d
+    RETURNING {_EVENT_COLUMNS};
+"""
+
+_SQL_UPDATE_EVENT = f"""
+    UPDATE events
+    SET business = %s,
+        course = %s,
+        time_range = %s,
+        people = %s,
+        place = %s,
+        admin = %s,
+        memo = %s,
+        color_key = %s
+    WHERE id = %s
+    RETURNING {_EVENT_COLUMNS};
+"""
+
+_SQL_DELETE_EVENT = "DELETE FROM events WHERE id = %s;"
+
+_SQL_LIST_BUSINESSES = "SELECT name FROM businesses ORDER BY name;"
+_SQL_ENSURE_BUSINESS = "INSERT INTO businesses(name) VALUES (%s) ON CONFLICT (name) DO NOTHING;"
+
+_SQL_GET_VERSION = "SELECT ver FROM data_versions WHERE name = %s;"
+_SQL_BUMP_VERSION = "UPDATE data_versions SET ver = ver + 1 WHERE name = %s RETURNING ver;"
+_SQL_NOTIFY = "SELECT pg_notify(%s, %s);"
+
+
+# 카드 본문 항목 (사업명은 제목으로 따로 표시)
+_CARD_FIELDS = (("course", "과정"), ("time", "시간"), ("people", "인원"), ("place", "장소"), ("admin", "행정"), ("memo", "메모"))
+
+
+def event_card_html(ev):
+    """
+    ✅ 카드 HTML을 서버에서 한 번 만들어 응답에 포함 (브라우저는 렌더링 때마다 조립하지 않음)
+    목록 응답은 버전별로 캐시되므로 같은 데이터에 대해 한 번만 계산된다.
+    """
+    parts = [f'<div class="event-title">{escape(ev["business"] or "")}</div>']
+    for key, label in _CARD_FIELDS:
+        value = ev[key]
+        if value:
+            parts.append(f'<div class="kv"><span class="k">{label}:</span>{escape(value)}</div>')
+    return "".join(parts)
+
+
+def fetch_events(cur):
+    keys = _EVENT_KEYS
+    items = [dict(zip(keys, r)) for r in cur.fetchall()]
+    for ev in items:
+        ev["html"] = event_card_html(ev)
+    return items
+
+
+def get_version(conn, name):
+    with conn.cursor() as cur:
+        cur.execute(_SQL_GET_VERSION, (name,))
+        return cur.fetchone()[0]
+
+
+def bump_version(cur, name):
+    cur.execute(_SQL_BUMP_VERSION, (name,))
+    return cur.fetchone()[0]
+
+
+# (start, end, business) -> (events 버전, 직렬화된 JSON bytes)
+_events_cache = {}
+_EVENTS_CACHE_MAX = 256
+
+# 응답 형식(필드, 카드 HTML, 클라이언트 JS)은 모두 이 파일에 있으므로 파일 해시를 ETag 에 섞는다.
+# 데이터 버전이 같아도 배포로 형식이 바뀌면 브라우저가 옛 본문을 304 로 재사용하지 않도록.
+with open(__file__, "rb") as _f:
+    _BUILD_TOKEN = hashlib.md5(_f.read()).hexdigest()[:8]
+_EVENTS_MAX_DAYS = 400
+
+# 사업 목록은 하나뿐이므로 (businesses 버전, JSON bytes) 한 쌍만 보관
+_businesses_cache = None
+
+
+def _versioned_response(body, etag):
+    # 브라우저가 매번 If-None-Match 로 재검증 → 변경 없으면 본문 없는 304
+    headers = {"Cache-Control": "private, no-cache"}
+    if body is None:
+        resp = Response(status=304, headers=headers)
+    else:
+        resp = Response(body, mimetype="application/json", headers=headers)
+    resp.set_etag(etag)
+    return resp
+
+
+# businesses 행은 삭제하지 않으므로, 이 프로세스가 한 번 확인한 사업명은 다시 INSERT하지 않는다.
+# 롤백될 수 있으므로 _known_businesses 에는 커밋이 끝난 뒤에 추가한다.
+_known_businesses = set()
+
+
+def ensure_business(cur, name):
+    if name not in _known_businesses:
+        cur.execute(_SQL_ENSURE_BUSINESS, (name,))
+        # 실제로 새 행이 들어간 경우에만 목록 캐시 무효화
+        if cur.rowcount:
+            bump_version(cur, "businesses")
 
 
 @app.get("/api/businesses")
 def api_businesses():
-    conn = get_conn()
-    try:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-            cur.execute("SELECT name FROM businesses ORDER BY name;")
-            rows = cur.fetchall()
-        names = [r["name"] for r in rows if r["name"]]
-        if "전체" not in names:
-            names.insert(0, "전체")
-        else:
-            names = ["전체"] + [x for x in names if x != "전체"]
-        return jsonify({"ok": True, "businesses": names})
-    finally:
-        conn.close()
+    global _businesses_cache
+    conn = get_db()
+    ver = get_version(conn, "businesses")
+    etag = f"businesses-{_BUILD_TOKEN}-{ver}"
+    if request.if_none_match.contains(etag):
+        return _versioned_response(None, etag)
+
+    cached = _businesses_cache
+    if cached and cached[0] == ver:
+        return _versioned_response(cached[1], etag)
+
+    with conn.cursor() as cur:
+        cur.execute(_SQL_LIST_BUSINESSES)
+        names = [name for (name,) in cur if name]
+    _known_businesses.update(names)
+    if "전체" not in names:
+        names.insert(0, "전체")
+    else:
+        names = ["전체"] + [x for x in names if x != "전체"]
+    body = orjson.dumps({"ok": True, "businesses": names})
+    _businesses_cache = (ver, body)
+    return _versioned_response(body, etag)
 
 
 @app.post("/api/businesses")
@@ -189,14 +526,11 @@ def api_add_business():
     name = clean_str(data.get("name"))
     if not name:
         return jsonify({"ok": False, "error": "사업명을 입력하세요."}), 400
-    conn = get_conn()
-    conn.autocommit = True
-    try:
-        with conn.cursor() as cur:
-            cur.execute("INSERT INTO businesses(name) VALUES (%s) ON CONFLICT (name) DO NOTHING;", (name,))
-        return jsonify({"ok": True})
-    finally:
-        conn.close()
+    conn = get_db()
+    with transaction(conn) as cur:
+        ensure_business(cur, name)
+    _known_businesses.add(name)
+    return jsonify({"ok": True})
 
 
 @app.get("/api/events")
@@ -205,26 +539,43 @@ def api_list_events():
     end = parse_date(request.args.get("end"))
     business = request.args.get("business")
 
-    conn = get_conn()
-    try:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-            q = "SELECT * FROM events WHERE 1=1"
-            params = []
-            if start:
-                q += " AND event_date >= %s"
-                params.append(start)
-            if end:
-                q += " AND event_date <= %s"
-                params.append(end)
-            if business and business != "전체":
-                q += " AND business = %s"
-                params.append(business)
-            q += " ORDER BY event_date ASC, id ASC;"
-            cur.execute(q, params)
-            rows = cur.fetchall()
-        return jsonify({"ok": True, "events": [event_row_to_dict(r) for r in rows]})
-    finally:
-        conn.close()
+    if business == "전체":
+        business = None
+
+    # 기간 없는 전체 조회는 받지 않는다 (화면은 항상 월/주 범위로 요청)
+    if not start or not end:
+        return jsonify({"ok": False, "error": "start/end 는 YYYY-MM-DD 형식으로 지정하세요."}), 400
+    if end < start:
+        return jsonify({"ok": False, "error": "종료일은 시작일보다 빠를 수 없습니다."}), 400
+    if (end - start).days >= _EVENTS_MAX_DAYS:
+        return jsonify({"ok": False, "error": f"조회 기간은 최대 {_EVENTS_MAX_DAYS}일입니다."}), 400
+
+    conn = get_db()
+    # 버전을 먼저 읽어야 그 사이에 들어온 쓰기가 옛 버전 캐시로 남지 않는다
+    ver = get_version(conn, "events")
+    etag = f"events-{_BUILD_TOKEN}-{ver}"
+    if request.if_none_match.contains(etag):
+        return _versioned_response(None, etag)
+
+    key = (start, end, business)
+    cached = _events_cache.get(key)
+    if cached and cached[0] == ver:
+        return _versioned_response(cached[1], etag)
+
+    with conn.cursor() as cur:
+        q = _SQL_LIST_EVENTS + " AND event_date >= %s AND event_date <= %s"
+        params = [start, end]
+        if business:
+            q += " AND business = %s"
+            params.append(business)
+        cur.execute(q + _SQL_LIST_EVENTS_ORDER, params)
+        items = fetch_events(cur)
+    # ver: 화면이 이 버전으로 그렸다는 것을 SSE 스트림(?since=)에 알려 그 뒤의 변경을 놓치지 않게 함
+    body = orjson.dumps({"ok": True, "ver": ver, "events": items})
+    if len(_events_cache) >= _EVENTS_CACHE_MAX:
+        _events_cache.clear()
+    _events_cache[key] = (ver, body)
+    return _versioned_response(body, etag)
 
 
 @app.post("/api/events")
@@ -264,27 +615,64 @@ def api_add_events_range():
     memo = clean_str(data.get("memo"))
     color_key = clean_str(data.get("color_key"))
 
-    conn = get_conn()
-    conn.autocommit = True
-    inserted = 0
-    try:
-        with conn.cursor() as cur:
-            cur.execute("INSERT INTO businesses(name) VALUES (%s) ON CONFLICT (name) DO NOTHING;", (business,))
-            d = start_d
-            while d <= end_d:
-                if d not in excluded:
-                    cur.execute(
-                        """
-                        INSERT INTO events(event_date, "start", "end", business, course, time_range, people, place, admin, memo, color_key)
-                        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                        """,
-                        (d, d, d, business, course, time_range, people, place, admin, memo, color_key),
-                    )
-                    inserted += 1
-                d += timedelta(days=1)
-        return jsonify({"ok": True, "inserted": inserted})
-    finally:
-        conn.close()
+    conn = get_db()
+    with transaction(conn) as cur:
+        ensure_business(cur, business)
+        cur.execute(
+            _SQL_INSERT_EVENT_RANGE,
+            (business, course, time_range, people, place, admin, memo, color_key,
+             start_d, end_d, sorted(excluded)),
+        )
+        created = fetch_events(cur)
+        ver = bump_version(cur, "events")
+        notify_events(cur, ver, "upsert", [ev["id"] for ev in created])
+    _known_businesses.add(business)
+    return jsonify({"ok": True, "inserted": len(created), "events": created})
+
+
+@app.post("/api/events/bulk")
+def api_add_events_bulk():
+    data = request.get_json(force=True, silent=True) or {}
+    items = data.get("events")
+    if not isinstance(items, list) or not items:
+        return jsonify({"ok": False, "error": "events 목록이 비어 있습니다."}), 400
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    names = set()
+    for i, item in enumerate(items, 1):
+        if not isinstance(item, dict):
+            return jsonify({"ok": False, "error": f"{i}번째 항목 형식이 올바르지 않습니다."}), 400
+        d = parse_date(clean_str(item.get("date")))
+        if not d:
+            return jsonify({"ok": False, "error": f"{i}번째 항목: 날짜는 YYYY-MM-DD 형식으로 입력하세요."}), 400
+        business = clean_str(item.get("business"))
+        if not business:
+            return jsonify({"ok": False, "error": f"{i}번째 항목: 사업명은 필수입니다."}), 400
+        names.add(business)
+        # None 은 따옴표 없는 빈 칸으로 쓰여 COPY 에서 NULL 이 된다
+        writer.writerow((
+            d, d, d, business,
+            clean_str(item.get("course")),
+            clean_str(item.get("time")),
+            clean_str(item.get("people")),
+            clean_str(item.get("place")),
+            clean_str(item.get("admin")),
+            clean_str(item.get("memo")),
+            clean_str(item.get("color_key")),
+        ))
+    buf.seek(0)
+
+    conn = get_db()
+    with transaction(conn) as cur:
+        for name in names:
+            ensure_business(cur, name)
+        cur.copy_expert(_SQL_COPY_EVENTS, buf)
+        inserted = cur.rowcount
+        ver = bump_version(cur, "events")
+        notify_events(cur, ver, "reload")
+    _known_businesses.update(names)
+    return jsonify({"ok": True, "inserted": inserted})
 
 
 @app.patch("/api/events/<int:event_id>")
@@ -303,314 +691,376 @@ def api_update_event(event_id: int):
     if business is None:
         return jsonify({"ok": False, "error": "사업명은 필수입니다."}), 400
 
-    conn = get_conn()
-    conn.autocommit = True
-    try:
-        with conn.cursor() as cur:
-            cur.execute("INSERT INTO businesses(name) VALUES (%s) ON CONFLICT (name) DO NOTHING;", (business,))
-            cur.execute(
-                """
-                UPDATE events
-                SET business = %s,
-                    course = %s,
-                    time_range = %s,
-                    people = %s,
-                    place = %s,
-                    admin = %s,
-                    memo = %s,
-                    color_key = %s
-                WHERE id = %s
-                """,
-                (business, course, time_range, people, place, admin, memo, color_key, event_id),
-            )
-        return jsonify({"ok": True})
-    finally:
-        conn.close()
+    conn = get_db()
+    with transaction(conn) as cur:
+        ensure_business(cur, business)
+        cur.execute(
+            _SQL_UPDATE_EVENT,
+            (business, course, time_range, people, place, admin, memo, color_key, event_id),
+        )
+        rows = fetch_events(cur)
+        if rows:
+            ver = bump_version(cur, "events")
+            notify_events(cur, ver, "upsert", [event_id])
+    _known_businesses.add(business)
+    return jsonify({"ok": True, "event": rows[0] if rows else None})
 
 
 @app.delete("/api/events/<int:event_id>")
 def api_delete_event(event_id: int):
-    conn = get_conn()
-    conn.autocommit = True
-    try:
+    conn = get_db()
+    with transaction(conn) as cur:
+        cur.execute(_SQL_DELETE_EVENT, (event_id,))
+        if cur.rowcount:
+            ver = bump_version(cur, "events")
+            notify_events(cur, ver, "delete", [event_id])
+    return jsonify({"ok": True})
+
+
+# ---- 실시간 반영: 쓰기 → NOTIFY → 워커별 LISTEN 스레드 → SSE 구독자 ----
+_NOTIFY_CHANNEL = "events_changed"
+# NOTIFY payload 는 8000바이트 제한이 있으므로 id 가 이보다 많으면 전체 재조회로 대신
+_NOTIFY_MAX_IDS = 500
+
+# 스트림 하나가 gthread 스레드 하나를 차지하므로 주기적으로 끊고 브라우저가 Last-Event-ID 로 다시 붙게 함
+SSE_MAX_SECONDS = int(os.getenv("SSE_MAX_SECONDS", "300"))
+_SSE_PING_SECONDS = 15
+# 동시 스트림 상한을 넘어 503 으로 돌려보낼 때 재시도 간격(초)
+_SSE_RETRY_SECONDS = 30
+_SSE_RELOAD = b'data: {"op":"reload"}\n\n'
+# 이 시간(초) 동안 알림이 없으면 LISTEN 연결이 살아 있는지 SELECT 1 로 확인
+_LISTEN_CHECK_SECONDS = 30
+# 워커 스레드 중 SSE 스트림이 차지하지 못하게 남겨둘 일반 요청용 스레드 수
+_API_THREADS = 8
+
+_subscribers = set()
+_stream_slots = None
+_subscribers_lock = threading.Lock()
+_listener_started = False
+# LISTEN 이 걸려 있는 동안만 set. 스트림은 이걸 기다린 뒤에 버전을 읽어야 그 사이의 알림을 놓치지 않는다
+_listener_ready = threading.Event()
+_LISTENER_READY_WAIT_SECONDS = 5
+
+
+def notify_events(cur, ver, op, ids=()):
+    # 트랜잭션 안에서 보내면 커밋될 때만 전달되고, 롤백되면 함께 사라진다
+    if len(ids) > _NOTIFY_MAX_IDS:
+        op, ids = "reload", ()
+    payload = orjson.dumps({"ver": ver, "op": op, "ids": list(ids)}).decode("utf-8")
+    cur.execute(_SQL_NOTIFY, (_NOTIFY_CHANNEL, payload))
+
+
+def _sse_message(ver, payload):
+    return b"id: %d\ndata: %s\n\n" % (ver, orjson.dumps(payload))
+
+
+def _delta_message(conn, raw):
+    # 구독자 수와 관계없이 알림 1건당 한 번만 행을 읽고 직렬화
+    note = orjson.loads(raw)
+    if note["op"] == "upsert":
         with conn.cursor() as cur:
-            cur.execute("DELETE FROM events WHERE id = %s;", (event_id,))
-        return jsonify({"ok": True})
-    finally:
-        conn.close()
-
-
-def _html():
-    return r"""<!doctype html>
-<html lang="ko">
-<head>
-  <meta charset="utf-8"/>
-  <meta name="viewport" content="width=device-width,initial-scale=1,viewport-fit=cover"/>
-  <title>포항산학 월별일정</title>
-  <style>
-    :root{
-      --bg:#f6f7fb;
-      --card:#ffffff;
-      --line:#dfe3ea;
-      --text:#111827;
-      --muted:#6b7280;
-      --primary:#2563eb;
-      --danger:#dc2626;
-      --shadow:0 6px 22px rgba(0,0,0,.06);
-      --radius:16px;
-      --sun:#dc2626;
-      --sat:#2563eb;
-    }
-    *{box-sizing:border-box}
-    body{margin:0;font-family:system-ui,-apple-system,Segoe UI,Roboto,Apple SD Gothic Neo,Noto Sans KR,Arial,sans-serif;background:var(--bg);color:var(--text)}
-
-    .wrap{max-width:3200px;margin:0 auto;padding:14px 10px}
-    @media (min-width: 1600px){ .wrap{padding:18px 14px} }
-
-    .top{display:flex;flex-direction:column;gap:10px;align-items:center;justify-content:center;padding:12px 10px 6px}
-    h1{margin:0;font-size:44px;letter-spacing:-1px}
-    h2{margin:0;font-size:30px;font-weight:900}
-    .controls{width:100%;display:flex;flex-wrap:wrap;gap:10px;align-items:center;justify-content:center;padding:10px 0 6px}
-    button, select, input, textarea{
-      font:inherit;border:1px solid var(--line);background:#fff;border-radius:10px;
-      padding:10px 12px;min-height:44px
-    }
-    button{cursor:pointer;font-weight:800}
-    button.primary{background:var(--primary);color:white;border-color:var(--primary)}
-    button.ghost{background:#fff}
-    button:active{transform:translateY(1px)}
-    select{min-width:120px}
-    .row{display:flex;gap:10px;align-items:center;flex-wrap:wrap;justify-content:center}
-
-    .panel{background:var(--card);border:1px solid var(--line);border-radius:var(--radius);box-shadow:var(--shadow);overflow:hidden}
-
-    table{width:100%;border-collapse:collapse;table-layout:fixed}
-    th,td{border:1px solid var(--line);vertical-align:top;background:#fff}
-    th{padding:10px 6px;font-size:15px;background:#fbfbfd}
-    .sun{color:var(--sun)}
-    .sat{color:var(--sat)}
-
-    .cell{position:relative;height:170px;padding:8px}
-    @media (max-width: 1200px){ .cell{height:150px} }
-    @media (max-width: 820px){ .cell{height:122px} }
-
-    /* ✅ 날짜 숫자 색상 (일/토) */
-    .date{font-weight:1000;font-size:14px;position:absolute;top:8px;left:10px;color:#111827}
-    .date.sun{color:var(--sun)}
-    .date.sat{color:var(--sat)}
-    .date.muted{color:#c0c4cc}
-    .date.muted.sun{color:rgba(220,38,38,.45)}
-    .date.muted.sat{color:rgba(37,99,235,.45)}
-
-    /* ✅ 월별 카드: 무조건 2열만 */
-    .events{
-      margin-top:26px;
-      display:grid;
-      grid-template-columns:repeat(2, minmax(0,1fr));
-      gap:10px;
-      align-content:start
-    }
-    @media (max-width: 820px){
-      .events{ grid-template-columns:1fr; gap:8px; margin-top:22px; }
-    }
-
-    /* ✅ 카드: 폭/가독성 + 줄바꿈 방지 */
-    .event-card{
-      border:1px solid var(--line);
-      border-radius:14px;
-      padding:12px 12px;
-      background:#fff;
-      box-shadow:0 2px 10px rgba(0,0,0,.04);
-      cursor:pointer;
-      user-select:none;
-      overflow:hidden;
-      min-height:76px
-    }
-    .event-card:hover{border-color:#c9d1ff}
-
-    /* 사업명(타이틀)은 상대적으로 크게 유지하지만 한줄로(… 처리) */
-    .event-title{
-      font-weight:1000;
-      font-size:16px;
-      line-height:1.2;
-      margin-bottom:6px;
-      white-space:nowrap;
-      overflow:hidden;
-      text-overflow:ellipsis;
-    }
-
-    /* ✅ 사업명 제외 항목은 더 작게 + 한줄(… 처리) */
-    .kv{
-      font-size:12px;
-      line-height:1.25;
-      color:#111827;
-      white-space:nowrap;
-      overflow:hidden;
-      text-overflow:ellipsis;
-    }
-    .kv .k{
-      color:var(--muted);
-      font-weight:900;
-      margin-right:6px;
-    }
-    .muted{color:var(--muted);font-weight:700}
-
-    .biz-a{background:#fce7f3}
-    .biz-b{background:#e0f2fe}
-    .biz-c{background:#dcfce7}
-    .biz-d{background:#fef9c3}
-    .biz-e{background:#ede9fe}
-
-    .week-td{padding:12px;background:transparent;}
-    .week-list{display:flex;flex-direction:column;gap:14px;}
-    .week-day{border:1px solid var(--line);border-radius:16px;background:#fff;padding:12px;}
-    .week-day-head{display:flex;justify-content:space-between;align-items:center;margin-bottom:10px;gap:10px;}
-
-    /* ✅ 주별 날짜도 일/토 색상 적용 */
-    .week-day-title{font-weight:1000;}
-    .week-day-title.sun{color:var(--sun)}
-    .week-day-title.sat{color:var(--sat)}
-
-    .week-day-sub{color:var(--muted);font-size:12px;}
-
-    .week-cards{
-      display:grid;
-      grid-template-columns:repeat(3,minmax(0,1fr));
-      gap:12px;
-    }
-    @media (max-width: 1200px){.week-cards{grid-template-columns:repeat(2,minmax(0,1fr));}}
-    @media (max-width: 700px){.week-cards{grid-template-columns:1fr;}}
-
-    .backdrop{position:fixed;inset:0;background:rgba(0,0,0,.45);display:none;align-items:center;justify-content:center;padding:14px;z-index:50}
-    .modal{width:min(780px, 100%);background:#fff;border-radius:18px;border:1px solid var(--line);box-shadow:0 18px 50px rgba(0,0,0,.25);overflow:hidden}
-    .modal-head{padding:14px 16px;border-bottom:1px solid var(--line);display:flex;justify-content:space-between;align-items:center;gap:10px}
-    .modal-title{font-weight:1000}
-    .modal-body{padding:14px 16px;display:flex;flex-direction:column;gap:10px}
-    .grid2{display:grid;grid-template-columns:1fr 1fr;gap:10px}
-    label{font-weight:900;font-size:13px;color:#374151}
-    .field{display:flex;flex-direction:column;gap:6px}
-    textarea{min-height:86px;resize:vertical}
-    .modal-foot{padding:12px 16px;border-top:1px solid var(--line);display:flex;justify-content:flex-end;gap:10px;flex-wrap:wrap}
-    button.danger{background:var(--danger);color:#fff;border-color:var(--danger)}
-    .hint{font-size:12px;color:var(--muted);font-weight:700}
-
-    @media (max-width: 820px){
-      .wrap{padding:10px}
-      h1{font-size:34px}
-      h2{font-size:22px}
-      .event-title{font-size:14px}
-      .kv{font-size:11px}
-      .grid2{grid-template-columns:1fr}
-    }
-  </style>
-</head>
-<body>
-  <div class="wrap">
-    <div class="top">
-      <h1>포항산학 월별일정</h1>
-      <h2 id="currentMonth">-</h2>
-
-      <div class="controls">
-        <div class="row">
-          <button id="prevBtn" class="ghost">◀ 이전</button>
-          <button id="nextBtn" class="ghost">다음 ▶</button>
-          <button id="monthViewBtn" class="ghost">월별</button>
-          <button id="weekViewBtn" class="ghost">주별</button>
-        </div>
+            cur.execute(_SQL_LIST_EVENTS + " AND id = ANY(%s)" + _SQL_LIST_EVENTS_ORDER, (note["ids"],))
+            return _sse_message(note["ver"], {"op": "upsert", "events": fetch_events(cur)})
+    return _sse_message(note["ver"], {"op": note["op"], "ids": note["ids"]})
+
+
+def _broadcast(msg):
+    with _subscribers_lock:
+        targets = list(_subscribers)
+    for q in targets:
+        q.put(msg)
+
+
+def _listen_loop():
+    reconnecting = False
+    while True:
+        conn = None
+        try:
+            # TCP keepalive: 응답 없이 끊긴 연결도 SELECT 1 이 무한정 기다리지 않고 에러가 나도록
+            conn = connect_db(keepalives=1, keepalives_idle=30, keepalives_interval=10, keepalives_count=3)
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {_NOTIFY_CHANNEL};")
+            if reconnecting:
+                # 끊긴 동안 놓친 알림은 LISTEN 이 다시 걸린 뒤에 한 번만 전체 재조회로 맞춘다
+                # (그 전에 재조회하면 재조회 ~ LISTEN 사이의 쓰기를 또 놓침)
+                _broadcast(_SSE_RELOAD)
+                reconnecting = False
+            _listener_ready.set()
+            while True:
+                if select.select([conn], [], [], _LISTEN_CHECK_SECONDS)[0]:
+                    conn.poll()
+                else:
+                    with conn.cursor() as cur:
+                        cur.execute("SELECT 1;")
+                # SELECT 1 도중에 도착한 알림도 conn.notifies 에 쌓이므로 여기서 함께 처리
+                while conn.notifies:
+                    note = conn.notifies.pop(0)
+                    if not _subscribers:
+                        continue
+                    try:
+                        msg = _delta_message(conn, note.payload)
+                    except (ValueError, KeyError, TypeError):
+                        # 형식이 다른(이전 버전 등) 알림은 건너뛰고 구독자에게는 전체 재조회로 대신
+                        app.logger.warning("ignoring malformed %s payload: %r", _NOTIFY_CHANNEL, note.payload)
+                        msg = _SSE_RELOAD
+                    _broadcast(msg)
+        except Exception:
+            # 어떤 오류든 스레드가 죽지 않고 다시 LISTEN
+            app.logger.exception("events listener failed; reconnecting")
+            _listener_ready.clear()
+            reconnecting = True
+            time.sleep(1)
+        finally:
+            if conn is not None and not conn.closed:
+                conn.close()
+
+
+def _stream_limit():
+    # 스트림 하나가 gthread 스레드 하나를 최대 SSE_MAX_SECONDS 동안 붙잡으므로
+    # 스레드 중 일반 API 요청용(최대 _API_THREADS 개)을 남기고 나머지를 스트림에 쓴다.
+    # 스트림은 브라우저당 하나(리더 탭)이므로 이 값 × 워커 수 = 동시에 실시간 반영되는 브라우저 수
+    threads = _worker_threads()
+    return int(os.getenv("SSE_MAX_STREAMS") or max(1, threads - min(_API_THREADS, threads // 2)))
+
+
+def _get_stream_slots():
+    global _stream_slots
+    if _stream_slots is None:
+        with _subscribers_lock:
+            if _stream_slots is None:
+                _stream_slots = threading.BoundedSemaphore(_stream_limit())
+    return _stream_slots
+
+
+def _subscribe(q):
+    global _listener_started
+    with _subscribers_lock:
+        _subscribers.add(q)
+        # fork 이후 워커 안에서 처음 구독할 때 LISTEN 스레드를 띄운다
+        if not _listener_started:
+            threading.Thread(target=_listen_loop, name="events-listener", daemon=True).start()
+            _listener_started = True
+
+
+def _unsubscribe(q):
+    with _subscribers_lock:
+        _subscribers.discard(q)
+
+
+@app.get("/api/events/stream")
+def api_events_stream():
+    slots = _get_stream_slots()
+    if not slots.acquire(blocking=False):
+        # 상한 초과 → 기다리지 않고 바로 돌려보냄. 클라이언트는 Retry-After 뒤에 다시 연결한다
+        resp = jsonify({"ok": False, "error": "실시간 연결이 많아 잠시 후 다시 연결합니다."})
+        resp.status_code = 503
+        resp.headers["Retry-After"] = str(_SSE_RETRY_SECONDS)
+        resp.headers["Cache-Control"] = "no-store"
+        return resp
+    # 클라이언트가 이미 가진 데이터 버전: 재연결이면 Last-Event-ID, 첫 연결이면 화면을 그린 /api/events 의 ver
+    known = request.headers.get("Last-Event-ID") or request.args.get("since")
+
+    def stream():
+        q = queue.SimpleQueue()
+        # 구독을 먼저 해야 버전을 읽는 사이에 들어온 변경도 놓치지 않는다 (중복 적용은 클라이언트에서 무해)
+        _subscribe(q)
+        try:
+            # 워커의 첫 스트림이면 방금 띄운 LISTEN 스레드가 실제로 LISTEN 할 때까지 기다린다
+            ready = _listener_ready.wait(_LISTENER_READY_WAIT_SECONDS)
+            with db_conn() as conn:
+                ver = get_version(conn, "events")
+
+            yield b"retry: 3000\n\n"
+            if not ready or (known is not None and known != str(ver)):
+                # 클라이언트가 가진 버전 이후 변경이 있었음(또는 LISTEN 이 아직 안 걸림) → 전체 재조회
+                yield _sse_message(ver, {"op": "reload"})
+            else:
+                yield b"id: %d\n\n" % ver
+
+            deadline = time.monotonic() + SSE_MAX_SECONDS
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    yield q.get(timeout=min(_SSE_PING_SECONDS, remaining))
+                except queue.Empty:
+                    yield b": ping\n\n"
+        finally:
+            _unsubscribe(q)
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    resp = Response(stream(), mimetype="text/event-stream", headers=headers)
+    # 제너레이터가 한 번도 돌지 않고 끊겨도 close 는 항상 불리므로 여기서 자리를 반납
+    resp.call_on_close(slots.release)
+    return resp
+
+
+def _css():
+    return r""":root{
+  --bg:#f6f7fb;
+  --card:#ffffff;
+  --line:#dfe3ea;
+  --text:#111827;
+  --muted:#6b7280;
+  --primary:#2563eb;
+  --danger:#dc2626;
+  --shadow:0 6px 22px rgba(0,0,0,.06);
+  --radius:16px;
+  --sun:#dc2626;
+  --sat:#2563eb;
+}
+*{box-sizing:border-box}
+body{margin:0;font-family:system-ui,-apple-system,Segoe UI,Roboto,Apple SD Gothic Neo,Noto Sans KR,Arial,sans-serif;background:var(--bg);color:var(--text)}
+
+.wrap{max-width:3200px;margin:0 auto;padding:14px 10px}
+@media (min-width: 1600px){ .wrap{padding:18px 14px} }
+
+.top{display:flex;flex-direction:column;gap:10px;align-items:center;justify-content:center;padding:12px 10px 6px}
+h1{margin:0;font-size:44px;letter-spacing:-1px}
+h2{margin:0;font-size:30px;font-weight:900}
+.controls{width:100%;display:flex;flex-wrap:wrap;gap:10px;align-items:center;justify-content:center;padding:10px 0 6px}
+button, select, input, textarea{
+  font:inherit;border:1px solid var(--line);background:#fff;border-radius:10px;
+  padding:10px 12px;min-height:44px
+}
+button{cursor:pointer;font-weight:800}
+button.primary{background:var(--primary);color:white;border-color:var(--primary)}
+button.ghost{background:#fff}
+button:active{transform:translateY(1px)}
+select{min-width:120px}
+.row{display:flex;gap:10px;align-items:center;flex-wrap:wrap;justify-content:center}
+
+.panel{background:var(--card);border:1px solid var(--line);border-radius:var(--radius);box-shadow:var(--shadow);overflow:hidden}
+
+table{width:100%;border-collapse:collapse;table-layout:fixed}
+th,td{border:1px solid var(--line);vertical-align:top;background:#fff}
+th{padding:10px 6px;font-size:15px;background:#fbfbfd}
+.sun{color:var(--sun)}
+.sat{color:var(--sat)}
+
+.cell{position:relative;height:170px;padding:8px}
+@media (max-width: 1200px){ .cell{height:150px} }
+@media (max-width: 820px){ .cell{height:122px} }
+
+/* ✅ 날짜 숫자 색상 (일/토) */
+.date{font-weight:1000;font-size:14px;position:absolute;top:8px;left:10px;color:#111827}
+.date.sun{color:var(--sun)}
+.date.sat{color:var(--sat)}
+.date.muted{color:#c0c4cc}
+.date.muted.sun{color:rgba(220,38,38,.45)}
+.date.muted.sat{color:rgba(37,99,235,.45)}
+
+/* ✅ 월별 카드: 무조건 2열만 */
+.events{
+  margin-top:26px;
+  display:grid;
+  grid-template-columns:repeat(2, minmax(0,1fr));
+  gap:10px;
+  align-content:start
+}
+@media (max-width: 820px){
+  .events{ grid-template-columns:1fr; gap:8px; margin-top:22px; }
+}
 
-        <div class="row">
-          <span style="font-weight:1000;font-size:20px">사업명:</span>
-          <select id="businessFilter"></select>
-          <button id="resetFilterBtn" class="ghost">필터 초기화</button>
-          <button id="openAddBtn" class="primary">+ 일정 추가하기</button>
-        </div>
-      </div>
-    </div>
+/* ✅ 카드: 폭/가독성 + 줄바꿈 방지 */
+.event-card{
+  border:1px solid var(--line);
+  border-radius:14px;
+  padding:12px 12px;
+  background:#fff;
+  box-shadow:0 2px 10px rgba(0,0,0,.04);
+  cursor:pointer;
+  user-select:none;
+  overflow:hidden;
+  min-height:76px
+}
+.event-card:hover{border-color:#c9d1ff}
+
+/* 사업명(타이틀)은 상대적으로 크게 유지하지만 한줄로(… 처리) */
+.event-title{
+  font-weight:1000;
+  font-size:16px;
+  line-height:1.2;
+  margin-bottom:6px;
+  white-space:nowrap;
+  overflow:hidden;
+  text-overflow:ellipsis;
+}
 
-    <div class="panel">
-      <table>
-        <thead>
-          <tr>
-            <th class="sun">일</th><th>월</th><th>화</th><th>수</th><th>목</th><th>금</th><th class="sat">토</th>
-          </tr>
-        </thead>
-        <tbody id="calendarBody"></tbody>
-      </table>
-    </div>
-  </div>
+/* ✅ 사업명 제외 항목은 더 작게 + 한줄(… 처리) */
+.kv{
+  font-size:12px;
+  line-height:1.25;
+  color:#111827;
+  white-space:nowrap;
+  overflow:hidden;
+  text-overflow:ellipsis;
+}
+.kv .k{
+  color:var(--muted);
+  font-weight:900;
+  margin-right:6px;
+}
+.muted{color:var(--muted);font-weight:700}
+
+.biz-a{background:#fce7f3}
+.biz-b{background:#e0f2fe}
+.biz-c{background:#dcfce7}
+.biz-d{background:#fef9c3}
+.biz-e{background:#ede9fe}
+
+.week-td{padding:12px;background:transparent;}
+.week-list{display:flex;flex-direction:column;gap:14px;}
+.week-day{border:1px solid var(--line);border-radius:16px;background:#fff;padding:12px;}
+.week-day-head{display:flex;justify-content:space-between;align-items:center;margin-bottom:10px;gap:10px;}
+
+/* ✅ 주별 날짜도 일/토 색상 적용 */
+.week-day-title{font-weight:1000;}
+.week-day-title.sun{color:var(--sun)}
+.week-day-title.sat{color:var(--sat)}
+
+.week-day-sub{color:var(--muted);font-size:12px;}
+
+.week-cards{
+  display:grid;
+  grid-template-columns:repeat(3,minmax(0,1fr));
+  gap:12px;
+}
+@media (max-width: 1200px){.week-cards{grid-template-columns:repeat(2,minmax(0,1fr));}}
+@media (max-width: 700px){.week-cards{grid-template-columns:1fr;}}
+
+.backdrop{position:fixed;inset:0;background:rgba(0,0,0,.45);display:none;align-items:center;justify-content:center;padding:14px;z-index:50}
+.modal{width:min(780px, 100%);background:#fff;border-radius:18px;border:1px solid var(--line);box-shadow:0 18px 50px rgba(0,0,0,.25);overflow:hidden}
+.modal-head{padding:14px 16px;border-bottom:1px solid var(--line);display:flex;justify-content:space-between;align-items:center;gap:10px}
+.modal-title{font-weight:1000}
+.modal-body{padding:14px 16px;display:flex;flex-direction:column;gap:10px}
+.grid2{display:grid;grid-template-columns:1fr 1fr;gap:10px}
+label{font-weight:900;font-size:13px;color:#374151}
+.field{display:flex;flex-direction:column;gap:6px}
+textarea{min-height:86px;resize:vertical}
+.modal-foot{padding:12px 16px;border-top:1px solid var(--line);display:flex;justify-content:flex-end;gap:10px;flex-wrap:wrap}
+button.danger{background:var(--danger);color:#fff;border-color:var(--danger)}
+.hint{font-size:12px;color:var(--muted);font-weight:700}
+
+@media (max-width: 820px){
+  .wrap{padding:10px}
+  h1{font-size:34px}
+  h2{font-size:22px}
+  .event-title{font-size:14px}
+  .kv{font-size:11px}
+  .grid2{grid-template-columns:1fr}
+}
+"""
 
-  <!-- Add Modal -->
-  <div id="addBackdrop" class="backdrop">
-    <div class="modal">
-      <div class="modal-head">
-        <div class="modal-title">일정 추가(기간 등록)</div>
-        <button id="addCloseBtn" class="ghost">✕</button>
-      </div>
-      <div class="modal-body">
-        <div class="grid2">
-          <div class="field"><label>시작일</label><input id="addStart" type="date"/></div>
-          <div class="field"><label>종료일</label><input id="addEnd" type="date"/></div>
-        </div>
-        <div class="field">
-          <label>사업명</label>
-          <input id="addBusiness" placeholder="예: 청년 일경험"/>
-          <div class="hint">※ 신규 사업명은 입력하면 자동으로 목록에 추가됩니다.</div>
-        </div>
-        <div class="field"><label>과정</label><input id="addCourse" placeholder="예: 멀티캠퍼스"/></div>
-        <div class="grid2">
-          <div class="field"><label>시간</label><input id="addTime" placeholder="예: 10:00~14:00"/></div>
-          <div class="field"><label>인원</label><input id="addPeople" placeholder="예: 10"/></div>
-        </div>
-        <div class="grid2">
-          <div class="field"><label>장소</label><input id="addPlace" placeholder="예: 본관 3층"/></div>
-          <div class="field"><label>행정</label><input id="addAdmin" placeholder="예: 담당자명"/></div>
-        </div>
-        <div class="field"><label>메모</label><textarea id="addMemo" placeholder="추가 메모(선택)"></textarea></div>
-        <div class="field">
-          <label>제외할 날짜(선택)</label>
-          <input id="addExcluded" placeholder="예: 2026-01-07,2026-01-08"/>
-          <div class="hint">기간 중 특정 날짜만 빼고 저장하고 싶을 때</div>
-        </div>
-      </div>
-      <div class="modal-foot">
-        <button id="addSaveBtn" class="primary">저장</button>
-        <button id="addCancelBtn" class="ghost">닫기</button>
-      </div>
-    </div>
-  </div>
 
-  <!-- Edit Modal -->
-  <div id="editBackdrop" class="backdrop">
-    <div class="modal">
-      <div class="modal-head">
-        <div class="modal-title" id="editTitle">일정</div>
-        <button id="editCloseBtn" class="ghost">✕</button>
-      </div>
-      <div class="modal-body">
-        <div class="field"><label>날짜</label><input id="editDate" disabled/></div>
-        <div class="field"><label>사업명</label><input id="editBusiness"/></div>
-        <div class="field"><label>과정</label><input id="editCourse"/></div>
-        <div class="grid2">
-          <div class="field"><label>시간</label><input id="editTime"/></div>
-          <div class="field"><label>인원</label><input id="editPeople"/></div>
-        </div>
-        <div class="grid2">
-          <div class="field"><label>장소</label><input id="editPlace"/></div>
-          <div class="field"><label>행정</label><input id="editAdmin"/></div>
-        </div>
-        <div class="field"><label>메모</label><textarea id="editMemo"></textarea></div>
-        <div class="hint">※ 이 화면은 “선택한 날짜(해당 1건)”만 수정/삭제합니다.</div>
-      </div>
-      <div class="modal-foot">
-        <button id="editDeleteBtn" class="danger">이날 삭제</button>
-        <button id="editSaveBtn" class="primary">저장</button>
-        <button id="editCancelBtn" class="ghost">닫기</button>
-      </div>
-    </div>
-  </div>
-
-<script>
-let events = [];
+def _js():
+    return r"""// 일정은 id 색인과 날짜별 버킷으로만 보관 (칸마다 전체 배열을 훑지 않도록)
+let eventsById = new Map();
+// 화면 데이터가 반영한 서버 데이터 버전 (SSE 스트림을 열 때 ?since= 로 보냄)
+let eventsVer = null;
+let eventsByDate = new Map();
 let businesses = [];
 let viewMode = "month";
 let anchorDate = new Date();
@@ -618,35 +1068,13 @@ let anchorDate = new Date();
 function pad(n){ return String(n).padStart(2,"0"); }
 function formatISO(d){ return `${d.getFullYear()}-${pad(d.getMonth()+1)}-${pad(d.getDate())}`; }
 function startOfWeek(d){ const x=new Date(d); const day=x.getDay(); x.setDate(x.getDate()-day); x.setHours(0,0,0,0); return x; }
-function startOfMonth(d){ return new Date(d.getFullYear(), d.getMonth(), 1); }
-function endOfMonth(d){ return new Date(d.getFullYear(), d.getMonth()+1, 0); }
 
-function escapeHTML(s){
-  return String(s).replace(/[&<>"']/g, (m)=>({
-    "&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#039;"
-  }[m]));
-}
 function getBusinessClass(name){
   let h=0; for(let i=0;i<name.length;i++) h = (h*31 + name.charCodeAt(i)) >>> 0;
   const idx = h % 5;
   return ["biz-a","biz-b","biz-c","biz-d","biz-e"][idx];
 }
 
-/* ✅ 카드 항목 표기: '과정: xxx' 형태로 */
-function kvLine(label, value){
-  return `<div class="kv"><span class="k">${escapeHTML(label)}:</span>${escapeHTML(value)}</div>`;
-}
-function buildCardHTML(ev){
-  const lines = [];
-  if(ev.course) lines.push(kvLine("과정", ev.course));
-  if(ev.time) lines.push(kvLine("시간", ev.time));
-  if(ev.people) lines.push(kvLine("인원", ev.people));
-  if(ev.place) lines.push(kvLine("장소", ev.place));
-  if(ev.admin) lines.push(kvLine("행정", ev.admin));
-  if(ev.memo) lines.push(kvLine("메모", ev.memo));
-  return `<div class="event-title">${escapeHTML(ev.business||"")}</div>${lines.join("")}`;
-}
-
 // ✅ JSON 파싱 실패 방지
 async function fetchJson(url, opts){
   const r = await fetch(url, opts);
@@ -658,98 +1086,211 @@ async function fetchJson(url, opts){
   }
 }
 
-async function loadBusinesses(){
-  const j = await fetchJson("/api/businesses");
-  if(!j.ok) throw new Error(j.error || "사업명 로드 실패");
-  businesses = j.businesses;
+// 사업명 목록은 자주 바뀌지 않으므로 탭 세션 동안 잠깐 캐시
+const BIZ_CACHE_KEY = "sanhak.businesses";
+const BIZ_CACHE_TTL_MS = 5 * 60 * 1000;
+
+function readBusinessCache(){
+  try{
+    const c = JSON.parse(sessionStorage.getItem(BIZ_CACHE_KEY) || "null");
+    if(c && Date.now() - c.at < BIZ_CACHE_TTL_MS) return c.businesses;
+  }catch(e){}
+  return null;
+}
+function writeBusinessCache(list){
+  try{ sessionStorage.setItem(BIZ_CACHE_KEY, JSON.stringify({at: Date.now(), businesses: list})); }catch(e){}
+}
+
+async function loadBusinesses(force){
+  let list = force ? null : readBusinessCache();
+  if(!list){
+    const j = await fetchJson("/api/businesses");
+    if(!j.ok) throw new Error(j.error || "사업명 로드 실패");
+    list = j.businesses;
+    writeBusinessCache(list);
+  }
+  businesses = list;
   const sel = document.getElementById("businessFilter");
-  sel.innerHTML = "";
-  businesses.forEach(b=>{
+  const prevValue = sel.value;
+  sel.replaceChildren(...businesses.map(b=>{
     const opt = document.createElement("option");
     opt.value = b; opt.textContent = b;
-    sel.appendChild(opt);
-  });
-  sel.value = "전체";
+    return opt;
+  }));
+  sel.value = businesses.includes(prevValue) ? prevValue : "전체";
+}
+// 지금 화면에 보이는 날짜 범위 (월별은 앞뒤 달 칸 포함)
+function visibleRange(){
+  if(viewMode === "month"){
+    const cells = monthCells(anchorDate);
+    return [cells[0].iso, cells[cells.length-1].iso];
+  }
+  const dates = weekDates(startOfWeek(anchorDate));
+  return [dates[0], dates[6]];
 }
+
+// ✅ 보이는 범위만 받아온다. 빠르게 넘길 때 이전 요청은 취소해서 늦게 온 응답이 덮어쓰지 않도록
+let eventsAbort = null;
 async function loadEvents(){
-  const j = await fetchJson("/api/events");
+  const [start, end] = visibleRange();
+  if(eventsAbort) eventsAbort.abort();
+  const ctrl = eventsAbort = new AbortController();
+  const j = await fetchJson(`/api/events?start=${start}&end=${end}`, {signal: ctrl.signal});
   if(!j.ok) throw new Error(j.error || "이벤트 로드 실패");
-  events = j.events;
+  eventsById = new Map();
+  eventsByDate = new Map();
+  for(const ev of j.events) indexEvent(ev);
+  eventsVer = j.ver;
+}
+
+async function showView(){
+  try{
+    await loadEvents();
+    render();
+  }catch(err){
+    if(err.name !== "AbortError") alert("일정 로드 오류: " + err);
+  }
 }
 
 function render(){ (viewMode==="month") ? renderMonth() : renderWeek(); }
 
+function currentFilter(){ return document.getElementById("businessFilter").value || "전체"; }
+
+function dayEventsFor(iso, filter){
+  const bucket = eventsByDate.get(iso) || [];
+  if(filter === "전체") return bucket;
+  return bucket.filter(ev=>(ev.business||"") === filter);
+}
+
+function buildEventCard(ev){
+  const card = document.createElement("div");
+  card.className = "event-card " + getBusinessClass(ev.business || "");
+  card.dataset.id = ev.id;
+  card.innerHTML = ev.html; // 서버에서 이스케이프까지 끝난 카드 본문
+  return card;
+}
+
+// ✅ 저장/삭제 후 전체 재조회 없이 로컬 상태만 갱신
+function indexEvent(ev){
+  eventsById.set(ev.id, ev);
+  let bucket = eventsByDate.get(ev.event_date);
+  if(!bucket){ bucket = []; eventsByDate.set(ev.event_date, bucket); }
+  bucket.push(ev);
+}
+function unindexEvent(ev){
+  eventsById.delete(ev.id);
+  const bucket = eventsByDate.get(ev.event_date);
+  if(!bucket) return;
+  const i = bucket.indexOf(ev);
+  if(i >= 0) bucket.splice(i, 1);
+  if(bucket.length === 0) eventsByDate.delete(ev.event_date);
+}
+function upsertEvents(list){
+  for(const ev of list){
+    const prev = eventsById.get(ev.id);
+    const bucket = prev && prev.event_date === ev.event_date ? eventsByDate.get(prev.event_date) : null;
+    if(bucket){
+      bucket[bucket.indexOf(prev)] = ev;
+      eventsById.set(ev.id, ev);
+    }else{
+      if(prev) unindexEvent(prev);
+      indexEvent(ev);
+    }
+  }
+}
+function removeEvent(id){
+  const prev = eventsById.get(id);
+  if(prev) unindexEvent(prev);
+}
+
+// 월별 화면이면 바뀐 날짜 칸만 다시 그림 (주별은 7칸이라 통째로)
+function refreshDates(isoList){
+  if(viewMode !== "month"){ render(); return; }
+  const filter = currentFilter();
+  for(const iso of new Set(isoList)){
+    const evWrap = document.querySelector(`#calendarBody td[data-date="${iso}"] .events`);
+    if(!evWrap) continue;
+    evWrap.replaceChildren(...dayEventsFor(iso, filter).map(buildEventCard));
+  }
+}
+
+// 월별 화면의 날짜 칸(앞뒤 달 포함)을 한 번에 계산: 달마다 "YYYY-MM-" 접두어는 한 번만 만든다
+function monthCells(anchor){
+  const y = anchor.getFullYear(), m = anchor.getMonth();
+  const lead = new Date(y, m, 1).getDay();
+  const daysInMonth = new Date(y, m+1, 0).getDate();
+  const prevDays = new Date(y, m, 0).getDate();
+  const prefix = (yy, mm)=>{ const x = new Date(yy, mm, 1); return `${x.getFullYear()}-${pad(x.getMonth()+1)}-`; };
+  const prevPrefix = prefix(y, m-1), curPrefix = prefix(y, m), nextPrefix = prefix(y, m+1);
+
+  const count = Math.ceil((lead + daysInMonth) / 7) * 7;
+  const cells = new Array(count);
+  for(let i=0;i<count;i++){
+    const n = i - lead + 1;
+    let dayNum, iso, inMonth = false;
+    if(n < 1){ dayNum = prevDays + n; iso = prevPrefix + pad(dayNum); }
+    else if(n > daysInMonth){ dayNum = n - daysInMonth; iso = nextPrefix + pad(dayNum); }
+    else { dayNum = n; iso = curPrefix + pad(dayNum); inMonth = true; }
+    cells[i] = {iso, dayNum, inMonth, dow: i % 7};
+  }
+  return cells;
+}
+
 function renderMonth(){
   const body = document.getElementById("calendarBody");
-  body.innerHTML = "";
-
-  const mStart = startOfMonth(anchorDate);
-  const mEnd = endOfMonth(anchorDate);
-  document.getElementById("currentMonth").textContent = `${mStart.getFullYear()}년 ${mStart.getMonth()+1}월`;
+  const rows = document.createDocumentFragment();
+  const cellTpl = document.getElementById("monthCellTpl").content.firstElementChild;
 
-  const filter = document.getElementById("businessFilter").value || "전체";
+  document.getElementById("currentMonth").textContent = `${anchorDate.getFullYear()}년 ${anchorDate.getMonth()+1}월`;
 
-  const start = startOfWeek(new Date(mStart));
-  const end = new Date(startOfWeek(new Date(mEnd))); end.setDate(end.getDate()+6);
+  const filter = currentFilter();
+  const cells = monthCells(anchorDate);
 
-  const d = new Date(start);
-  while(d <= end){
+  for(let w=0; w<cells.length; w+=7){
     const tr = document.createElement("tr");
-    for(let i=0;i<7;i++){
-      const td = document.createElement("td");
-      td.className = "cell";
-      const iso = formatISO(d);
+    for(let i=w;i<w+7;i++){
+      const {iso, dayNum, inMonth, dow} = cells[i];
+      const td = cellTpl.cloneNode(true);
+      td.dataset.date = iso;
 
-      const inMonth = (d.getMonth() === mStart.getMonth());
-      const dateDiv = document.createElement("div");
+      const dateDiv = td.firstElementChild;
 
       // ✅ 날짜 색상: 일/토
-      const day = d.getDay(); // 0:일 6:토
-      let cls = "date";
-      if(!inMonth) cls += " muted";
-      if(day === 0) cls += " sun";
-      if(day === 6) cls += " sat";
-      dateDiv.className = cls;
-
-      dateDiv.textContent = d.getDate();
-      td.appendChild(dateDiv);
-
-      const evWrap = document.createElement("div");
-      evWrap.className = "events";
-
-      const dayEvents = events.filter(ev=>{
-        if(ev.event_date !== iso) return false;
-        if(filter !== "전체" && (ev.business||"") !== filter) return false;
-        return true;
-      });
-
-      dayEvents.forEach(ev=>{
-        const card = document.createElement("div");
-        card.className = "event-card " + getBusinessClass(ev.business || "");
-        card.addEventListener("click", ()=>openEditModal(ev, iso));
-        card.innerHTML = buildCardHTML(ev);
-        evWrap.appendChild(card);
-      });
-
-      td.appendChild(evWrap);
+      if(!inMonth) dateDiv.classList.add("muted");
+      if(dow === 0) dateDiv.classList.add("sun");
+      if(dow === 6) dateDiv.classList.add("sat");
+
+      dateDiv.textContent = dayNum;
+
+      const evWrap = td.lastElementChild;
+      dayEventsFor(iso, filter).forEach(ev=>evWrap.appendChild(buildEventCard(ev)));
+
       tr.appendChild(td);
-      d.setDate(d.getDate()+1);
     }
-    body.appendChild(tr);
+    rows.appendChild(tr);
   }
+  body.replaceChildren(rows);
+}
+
+// 주별 7일 날짜 문자열: UTC 자정 epoch ms 에 하루씩 더하기만 함 (setDate 정규화/서머타임 영향 없음)
+const DAY_MS = 86400000;
+function weekDates(ws){
+  const base = Date.UTC(ws.getFullYear(), ws.getMonth(), ws.getDate());
+  const dates = new Array(7);
+  for(let i=0;i<7;i++) dates[i] = new Date(base + i*DAY_MS).toISOString().slice(0, 10);
+  return dates;
 }
 
 function renderWeek(){
   const body = document.getElementById("calendarBody");
-  body.innerHTML = "";
 
   const ws = startOfWeek(anchorDate);
-  const we = new Date(ws); we.setDate(we.getDate()+6);
+  const dates = weekDates(ws);
 
   document.getElementById("currentMonth").textContent =
-    `${ws.getFullYear()}년 ${ws.getMonth()+1}월 (주별: ${formatISO(ws)} ~ ${formatISO(we)})`;
+    `${ws.getFullYear()}년 ${ws.getMonth()+1}월 (주별: ${dates[0]} ~ ${dates[6]})`;
 
-  const filter = document.getElementById("businessFilter").value || "전체";
+  const filter = currentFilter();
   const weekday = ["일","월","화","수","목","금","토"];
 
   const tr = document.createElement("tr");
@@ -759,33 +1300,20 @@ function renderWeek(){
 
   const wrap = document.createElement("div");
   wrap.className = "week-list";
+  const dayTpl = document.getElementById("weekDayTpl");
 
-  for(let i=0;i<7;i++){
-    const d = new Date(ws); d.setDate(ws.getDate()+i);
-    const iso = formatISO(d);
-
-    const dayEvents = events.filter(ev=>{
-      if(ev.event_date !== iso) return false;
-      if(filter !== "전체" && (ev.business||"") !== filter) return false;
-      return true;
-    });
-
-    const section = document.createElement("section");
-    section.className = "week-day";
+  for(let day=0; day<7; day++){ // 0:일 ~ 6:토
+    const iso = dates[day];
+    const dayEvents = dayEventsFor(iso, filter);
 
-    const head = document.createElement("div");
-    head.className = "week-day-head";
+    const section = dayTpl.content.firstElementChild.cloneNode(true);
 
     // ✅ 주별 날짜도 일/토 색상
-    const day = d.getDay();
-    const titleCls = (day===0) ? "week-day-title sun" : (day===6) ? "week-day-title sat" : "week-day-title";
-
-    head.innerHTML = `<div>
-        <div class="${titleCls}">${iso} (${weekday[day]})</div>
-        <div class="week-day-sub">일정 ${dayEvents.length}건</div>
-      </div>`;
-
-    section.appendChild(head);
+    const title = section.querySelector(".week-day-title");
+    if(day === 0) title.classList.add("sun");
+    if(day === 6) title.classList.add("sat");
+    title.textContent = `${iso} (${weekday[day]})`;
+    section.querySelector(".week-day-sub").textContent = `일정 ${dayEvents.length}건`;
 
     if(dayEvents.length === 0){
       const empty = document.createElement("div");
@@ -799,13 +1327,7 @@ function renderWeek(){
 
     const cards = document.createElement("div");
     cards.className = "week-cards";
-    dayEvents.forEach(ev=>{
-      const card = document.createElement("div");
-      card.className = "event-card " + getBusinessClass(ev.business || "");
-      card.addEventListener("click", ()=>openEditModal(ev, iso));
-      card.innerHTML = buildCardHTML(ev);
-      cards.appendChild(card);
-    });
+    dayEvents.forEach(ev=>cards.appendChild(buildEventCard(ev)));
 
     section.appendChild(cards);
     wrap.appendChild(section);
@@ -813,22 +1335,30 @@ function renderWeek(){
 
   td.appendChild(wrap);
   tr.appendChild(td);
-  body.appendChild(tr);
+  body.replaceChildren(tr);
 }
 
+// 카드 클릭은 tbody 하나에서 위임 처리 (카드마다 리스너를 달지 않음)
+document.getElementById("calendarBody").addEventListener("click", (e)=>{
+  const card = e.target.closest(".event-card");
+  if(!card) return;
+  const ev = eventsById.get(Number(card.dataset.id));
+  if(ev) openEditModal(ev, ev.event_date);
+});
+
 // nav
 document.getElementById("prevBtn").addEventListener("click", ()=>{
   if(viewMode === "month") anchorDate = new Date(anchorDate.getFullYear(), anchorDate.getMonth()-1, 1);
   else { anchorDate = new Date(anchorDate); anchorDate.setDate(anchorDate.getDate()-7); }
-  render();
+  showView();
 });
 document.getElementById("nextBtn").addEventListener("click", ()=>{
   if(viewMode === "month") anchorDate = new Date(anchorDate.getFullYear(), anchorDate.getMonth()+1, 1);
   else { anchorDate = new Date(anchorDate); anchorDate.setDate(anchorDate.getDate()+7); }
-  render();
+  showView();
 });
-document.getElementById("monthViewBtn").addEventListener("click", ()=>{ viewMode="month"; render(); });
-document.getElementById("weekViewBtn").addEventListener("click", ()=>{ viewMode="week"; render(); });
+document.getElementById("monthViewBtn").addEventListener("click", ()=>{ viewMode="month"; showView(); });
+document.getElementById("weekViewBtn").addEventListener("click", ()=>{ viewMode="week"; showView(); });
 document.getElementById("businessFilter").addEventListener("change", ()=>render());
 document.getElementById("resetFilterBtn").addEventListener("click", ()=>{
   document.getElementById("businessFilter").value = "전체"; render();
@@ -869,11 +1399,7 @@ document.getElementById("addSaveBtn").addEventListener("click", async ()=>{
   if(!business){ alert("사업명은 필수입니다."); return; }
 
   try{
-    await fetchJson("/api/businesses", {
-      method:"POST", headers:{"Content-Type":"application/json"},
-      body: JSON.stringify({name: business})
-    });
-
+    // 사업명 등록은 /api/events 에서 함께 처리됨
     const j = await fetchJson("/api/events", {
       method:"POST", headers:{"Content-Type":"application/json"},
       body: JSON.stringify({
@@ -890,10 +1416,10 @@ document.getElementById("addSaveBtn").addEventListener("click", async ()=>{
 
     if(!j.ok){ alert("저장 중 오류\n\n" + (j.error||"")); return; }
 
-    await loadBusinesses();
-    await loadEvents();
+    if(!businesses.includes(business)) await loadBusinesses(true);
+    upsertEvents(j.events);
     closeAddModal();
-    render();
+    refreshDates(j.events.map(ev=>ev.event_date));
   }catch(err){
     alert("저장 중 오류\n\n" + err);
   }
@@ -932,19 +1458,15 @@ document.getElementById("editSaveBtn").addEventListener("click", async ()=>{
   if(!payload.business){ alert("사업명은 필수입니다."); return; }
 
   try{
-    await fetchJson("/api/businesses", {
-      method:"POST", headers:{"Content-Type":"application/json"},
-      body: JSON.stringify({name: payload.business})
-    });
     const j = await fetchJson(`/api/events/${editingEventId}`, {
       method:"PATCH", headers:{"Content-Type":"application/json"},
       body: JSON.stringify(payload)
     });
     if(!j.ok){ alert("수정 오류\n\n" + (j.error||"")); return; }
-    await loadBusinesses();
-    await loadEvents();
+    if(!businesses.includes(payload.business)) await loadBusinesses(true);
+    if(j.event) upsertEvents([j.event]);
     closeEditModal();
-    render();
+    refreshDates(j.event ? [j.event.event_date] : []);
   }catch(err){
     alert("수정 오류\n\n" + err);
   }
@@ -954,36 +1476,280 @@ document.getElementById("editDeleteBtn").addEventListener("click", async ()=>{
   if(!editingEventId) return;
   if(!confirm("선택한 날짜의 일정 1건을 삭제할까요?")) return;
   try{
-    const j = await fetchJson(`/api/events/${editingEventId}`, {method:"DELETE"});
+    const id = editingEventId;
+    const iso = eventsById.get(id)?.event_date;
+    const j = await fetchJson(`/api/events/${id}`, {method:"DELETE"});
     if(!j.ok){ alert("삭제 오류\n\n" + (j.error||"")); return; }
-    await loadEvents();
+    removeEvent(id);
     closeEditModal();
-    render();
+    refreshDates(iso ? [iso] : []);
   }catch(err){
     alert("삭제 오류\n\n" + err);
   }
 });
 
+// ✅ 다른 사용자/탭의 변경을 SSE 로 받아 바뀐 행만 반영
+function applyDelta(msg){
+  if(msg.op === "reload"){
+    loadEvents().then(render).catch(()=>{});
+    return;
+  }
+  const dates = [];
+  if(msg.op === "upsert"){
+    for(const ev of msg.events){
+      const prev = eventsById.get(ev.id);
+      if(prev) dates.push(prev.event_date);
+      dates.push(ev.event_date);
+    }
+    upsertEvents(msg.events);
+    if(msg.events.some(ev=>!businesses.includes(ev.business))) loadBusinesses(true).catch(()=>{});
+  }else if(msg.op === "delete"){
+    for(const id of msg.ids){
+      const prev = eventsById.get(id);
+      if(prev) dates.push(prev.event_date);
+      removeEvent(id);
+    }
+  }
+  if(msg.ver) eventsVer = msg.ver;
+  if(dates.length) refreshDates(dates);
+}
+
+function openStream(deliver){
+  // 화면이 가진 버전을 알려주면 서버가 그 뒤에 바뀐 게 있을 때만 재조회를 지시한다
+  const es = new EventSource("/api/events/stream" + (eventsVer != null ? `?since=${eventsVer}` : ""));
+  es.onmessage = (e)=>{
+    const msg = JSON.parse(e.data);
+    if(e.lastEventId) msg.ver = Number(e.lastEventId);
+    deliver(msg);
+  };
+  es.onerror = ()=>{
+    // CONNECTING 이면 브라우저가 retry 간격으로 알아서 재연결. 503(상한 초과) 등으로 CLOSED 가 되면 직접 다시 연다
+    if(es.readyState !== EventSource.CLOSED) return;
+    setTimeout(()=>openStream(deliver), 30000);
+  };
+}
+
+function watchEvents(){
+  if(!window.EventSource) return;
+  // 탭마다 스트림을 열면 서버 스레드와 브라우저의 출처당 연결(6개)을 낭비하므로
+  // 한 탭(리더)만 스트림을 열고 받은 변경을 BroadcastChannel 로 다른 탭에 전달한다
+  if(!(navigator.locks && window.BroadcastChannel)){
+    openStream(applyDelta);
+    return;
+  }
+  const bc = new BroadcastChannel("sanhak-events");
+  bc.onmessage = (e)=>applyDelta(e.data);
+  const relay = (msg)=>{ applyDelta(msg); bc.postMessage(msg); };
+  // 락은 탭이 닫힐 때까지 쥐고 있음. 리더 탭이 닫히면 대기 중인 탭이 자기 버전(?since=)으로 이어받는다
+  navigator.locks.request("sanhak-events-stream", ()=>new Promise(()=>openStream(relay)));
+}
+
 // boot
 (async function(){
   try{
-    await loadBusinesses();
-    await loadEvents();
+    await Promise.all([loadBusinesses(), loadEvents()]);
     render();
+    watchEvents();
   }catch(err){
     alert("초기 로드 오류: " + err);
   }
 })();
-</script>
+"""
+
+
+def _asset(body: str, mimetype: str):
+    # 인코딩/압축은 임포트 시 한 번만 하고, 요청마다 미리 만든 bytes를 그대로 보낸다
+    data = body.encode("utf-8")
+    return {
+        "mimetype": mimetype,
+        "etag": hashlib.md5(data).hexdigest(),
+        "bodies": {
+            "identity": data,
+            "gzip": gzip.compress(data, compresslevel=9),
+            "br": brotli.compress(data, quality=11),
+        },
+    }
+
+
+_CSS_ASSET = _asset(_css(), "text/css")
+_JS_ASSET = _asset(_js(), "application/javascript")
+
+
+def _html():
+    return rf"""<!doctype html>
+<html lang="ko">
+<head>
+  <meta charset="utf-8"/>
+  <meta name="viewport" content="width=device-width,initial-scale=1,viewport-fit=cover"/>
+  <title>포항산학 월별일정</title>
+  <link rel="stylesheet" href="/static/app.css?v={_CSS_ASSET['etag'][:12]}"/>
+  <script defer src="/static/app.js?v={_JS_ASSET['etag'][:12]}"></script>
+</head>
+<body>
+  <div class="wrap">
+    <div class="top">
+      <h1>포항산학 월별일정</h1>
+      <h2 id="currentMonth">-</h2>
+
+      <div class="controls">
+        <div class="row">
+          <button id="prevBtn" class="ghost">◀ 이전</button>
+          <button id="nextBtn" class="ghost">다음 ▶</button>
+          <button id="monthViewBtn" class="ghost">월별</button>
+          <button id="weekViewBtn" class="ghost">주별</button>
+        </div>
+
+        <div class="row">
+          <span style="font-weight:1000;font-size:20px">사업명:</span>
+          <select id="businessFilter"></select>
+          <button id="resetFilterBtn" class="ghost">필터 초기화</button>
+          <button id="openAddBtn" class="primary">+ 일정 추가하기</button>
+        </div>
+      </div>
+    </div>
+
+    <div class="panel">
+      <table>
+        <thead>
+          <tr>
+            <th class="sun">일</th><th>월</th><th>화</th><th>수</th><th>목</th><th>금</th><th class="sat">토</th>
+          </tr>
+        </thead>
+        <tbody id="calendarBody"></tbody>
+      </table>
+    </div>
+  </div>
+
+  <!-- 월별 날짜 칸 (renderMonth에서 복제) -->
+  <template id="monthCellTpl">
+    <td class="cell"><div class="date"></div><div class="events"></div></td>
+  </template>
+
+  <!-- 주별 하루 섹션 (renderWeek에서 복제) -->
+  <template id="weekDayTpl">
+    <section class="week-day">
+      <div class="week-day-head">
+        <div>
+          <div class="week-day-title"></div>
+          <div class="week-day-sub"></div>
+        </div>
+      </div>
+    </section>
+  </template>
+
+  <!-- Add Modal -->
+  <div id="addBackdrop" class="backdrop">
+    <div class="modal">
+      <div class="modal-head">
+        <div class="modal-title">일정 추가(기간 등록)</div>
+        <button id="addCloseBtn" class="ghost">✕</button>
+      </div>
+      <div class="modal-body">
+        <div class="grid2">
+          <div class="field"><label>시작일</label><input id="addStart" type="date"/></div>
+          <div class="field"><label>종료일</label><input id="addEnd" type="date"/></div>
+        </div>
+        <div class="field">
+          <label>사업명</label>
+          <input id="addBusiness" placeholder="예: 청년 일경험"/>
+          <div class="hint">※ 신규 사업명은 입력하면 자동으로 목록에 추가됩니다.</div>
+        </div>
+        <div class="field"><label>과정</label><input id="addCourse" placeholder="예: 멀티캠퍼스"/></div>
+        <div class="grid2">
+          <div class="field"><label>시간</label><input id="addTime" placeholder="예: 10:00~14:00"/></div>
+          <div class="field"><label>인원</label><input id="addPeople" placeholder="예: 10"/></div>
+        </div>
+        <div class="grid2">
+          <div class="field"><label>장소</label><input id="addPlace" placeholder="예: 본관 3층"/></div>
+          <div class="field"><label>행정</label><input id="addAdmin" placeholder="예: 담당자명"/></div>
+        </div>
+        <div class="field"><label>메모</label><textarea id="addMemo" placeholder="추가 메모(선택)"></textarea></div>
+        <div class="field">
+          <label>제외할 날짜(선택)</label>
+          <input id="addExcluded" placeholder="예: 2026-01-07,2026-01-08"/>
+          <div class="hint">기간 중 특정 날짜만 빼고 저장하고 싶을 때</div>
+        </div>
+      </div>
+      <div class="modal-foot">
+        <button id="addSaveBtn" class="primary">저장</button>
+        <button id="addCancelBtn" class="ghost">닫기</button>
+      </div>
+    </div>
+  </div>
+
+  <!-- Edit Modal -->
+  <div id="editBackdrop" class="backdrop">
+    <div class="modal">
+      <div class="modal-head">
+        <div class="modal-title" id="editTitle">일정</div>
+        <button id="editCloseBtn" class="ghost">✕</button>
+      </div>
+      <div class="modal-body">
+        <div class="field"><label>날짜</label><input id="editDate" disabled/></div>
+        <div class="field"><label>사업명</label><input id="editBusiness"/></div>
+        <div class="field"><label>과정</label><input id="editCourse"/></div>
+        <div class="grid2">
+          <div class="field"><label>시간</label><input id="editTime"/></div>
+          <div class="field"><label>인원</label><input id="editPeople"/></div>
+        </div>
+        <div class="grid2">
+          <div class="field"><label>장소</label><input id="editPlace"/></div>
+          <div class="field"><label>행정</label><input id="editAdmin"/></div>
+        </div>
+        <div class="field"><label>메모</label><textarea id="editMemo"></textarea></div>
+        <div class="hint">※ 이 화면은 “선택한 날짜(해당 1건)”만 수정/삭제합니다.</div>
+      </div>
+      <div class="modal-foot">
+        <button id="editDeleteBtn" class="danger">이날 삭제</button>
+        <button id="editSaveBtn" class="primary">저장</button>
+        <button id="editCancelBtn" class="ghost">닫기</button>
+      </div>
+    </div>
+  </div>
+
 </body>
 </html>"""
 
 
+_INDEX_ASSET = _asset(_html(), "text/html")
+
+
+def _serve_asset(asset, cache_control):
+    # br 를 우선하되 클라이언트가 q 값으로 낮춘 경우는 그 순서를 따른다
+    enc = request.accept_encodings.best_match(("br", "gzip"), default="identity")
+    # 압축본과 원본은 서로 다른 표현이므로 ETag도 구분
+    etag = asset["etag"] if enc == "identity" else f"{asset['etag']}-{enc}"
+    headers = {"Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304, headers=headers)
+    else:
+        resp = Response(asset["bodies"][enc], mimetype=asset["mimetype"], headers=headers)
+        if enc != "identity":
+            resp.headers["Content-Encoding"] = enc
+    resp.set_etag(etag)
+    return resp
+
+
+# URL에 ?v=<etag> 가 붙으므로 내용이 바뀌면 주소도 바뀜 → 장기 캐시 안전
+_STATIC_CACHE = "public, max-age=31536000, immutable"
+
+
+@app.get("/static/app.css")
+def static_css():
+    return _serve_asset(_CSS_ASSET, _STATIC_CACHE)
+
+
+@app.get("/static/app.js")
+def static_js():
+    return _serve_asset(_JS_ASSET, _STATIC_CACHE)
+
+
 @app.get("/")
 def index():
-    return Response(_html(), mimetype="text/html")
+    return _serve_asset(_INDEX_ASSET, "public, max-age=300")
 
 
+# 로컬 확인용. 배포는 `gunicorn app:app` (gthread 설정은 gunicorn.conf.py)
 if __name__ == "__main__":
     port = int(os.getenv("PORT", "10000"))
     app.run(host="0.0.0.0", port=port)
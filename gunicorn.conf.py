@@ -0,0 +1,22 @@
+# `gunicorn app:app` 실행 시 현재 디렉터리의 이 파일을 자동으로 읽는다.
+# (app.run 은 개발용 서버라 keep-alive/동시 처리가 없음)
+import os
+
+bind = "0.0.0.0:{}".format(os.getenv("PORT", "10000"))
+
+# 워커 프로세스 × 스레드 수만큼 동시에 요청 처리.
+# 열린 /api/events/stream(SSE) 하나가 스레드 하나를 차지한다 (브라우저당 하나, 탭이 여러 개여도 리더 탭만 연결).
+# - SSE_MAX_STREAMS: 워커당 동시 스트림 수. 기본값 = threads - 8 (threads 가 16 미만이면 threads 의 절반)
+#   워커 수 × 이 값이 실시간 반영을 받는 브라우저 수. 넘치면 503 → 클라이언트가 30초 뒤 재시도
+# - PG_POOL_MAX: 워커별 DB 연결 풀 크기. 기본값 = threads - SSE_MAX_STREAMS (일반 요청용 스레드 수)
+# 기본값(2 워커 × 32 스레드)이면 동시 스트림 48개, DB 연결은 워커당 최대 8개 + LISTEN 1개.
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "32"))
+
+keepalive = 5
+
+
+def post_fork(server, worker):
+    # --threads 로 덮어쓴 값까지 포함한 실제 스레드 수를 앱의 DB 풀 크기·SSE 스트림 상한 기본값 계산에 넘긴다
+    os.environ["GUNICORN_THREADS"] = str(worker.cfg.threads)